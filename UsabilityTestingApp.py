@@ -1,87 +1,387 @@
 import streamlit as st
 import pandas as pd
+import os
+import re
 import time
+import queue
 import sqlite3
-import plotly.express as px
+import threading
+from contextlib import contextmanager
+import plotly.graph_objects as go
+import pyarrow as pa
 
 # Database initialization
 DB_NAME = "usability_data.db"
+# Task rows are buffered per session and written in one transaction once this many are pending.
+TASK_FLUSH_SIZE = 5
+# Applied once to every cached connection.
+SQLITE_PRAGMAS = (
+    "temp_store=MEMORY",
+    "cache_size=-64000",
+    "mmap_size=268435456",
+)
+# WAL + NORMAL sync avoids a full fsync on every single-row commit and lets the
+# reader connections query while a write is in progress.
+WRITER_PRAGMAS = ("journal_mode=WAL", "synchronous=NORMAL")
+# Read-only connections checked out by the Report; WAL lets them run alongside the writer.
+READER_POOL_SIZE = 4
+# Every write produces a new mtime key, so the report caches are bounded to keep
+# superseded snapshots from piling up in memory.
+REPORT_CACHE_ENTRIES = 16  # a few snapshots for each of the four tables
+CHART_CACHE_ENTRIES = 4
+# Rows pulled from a cursor per fetchmany() call when building report frames.
+FETCH_SIZE = 1000
 
-def get_connection():
-    return sqlite3.connect(DB_NAME, check_same_thread=False)
-
-def init_db():
-    with get_connection() as conn:
-        cursor = conn.cursor()
-        cursor.execute('''CREATE TABLE IF NOT EXISTS consent_data (
-            timestamp TEXT,
-            consent_given BOOLEAN)''')
-        cursor.execute('''CREATE TABLE IF NOT EXISTS demographic_data (
-            timestamp TEXT,
+TABLE_COLUMNS = {
+    "consent_data": ("timestamp", "consent_given"),
+    "demographic_data": ("timestamp", "name", "age", "occupation", "familiarity"),
+    "task_data": ("timestamp", "task_name", "success", "duration_seconds", "notes"),
+    "exit_data": ("timestamp", "satisfaction", "difficulty", "open_feedback"),
+}
+# Timestamps are stored as whole epoch seconds and only formatted for display in the report.
+TABLE_SCHEMAS = {
+    "consent_data": '''CREATE TABLE IF NOT EXISTS consent_data (
+            timestamp INTEGER,
+            consent_given BOOLEAN)''',
+    "demographic_data": '''CREATE TABLE IF NOT EXISTS demographic_data (
+            timestamp INTEGER,
             name TEXT,
             age INTEGER,
             occupation TEXT,
-            familiarity TEXT)''')
-        cursor.execute('''CREATE TABLE IF NOT EXISTS task_data (
-            timestamp TEXT,
+            familiarity TEXT)''',
+    "task_data": '''CREATE TABLE IF NOT EXISTS task_data (
+            timestamp INTEGER,
             task_name TEXT,
             success TEXT,
             duration_seconds REAL,
-            notes TEXT)''')
-        cursor.execute('''CREATE TABLE IF NOT EXISTS exit_data (
-            timestamp TEXT,
+            notes TEXT)''',
+    "exit_data": '''CREATE TABLE IF NOT EXISTS exit_data (
+            timestamp INTEGER,
             satisfaction INTEGER,
             difficulty INTEGER,
-            open_feedback TEXT)''')
-        conn.commit()
+            open_feedback TEXT)''',
+}
+# Created after any timestamp migration, since rebuilding task_data drops its indexes and
+# would leave views pointing at the renamed table. The (task_name, success) index covers
+# both GROUP BY views behind the report charts.
+DERIVED_SCHEMA = '''
+    CREATE INDEX IF NOT EXISTS idx_task_data_success ON task_data (success);
+    CREATE INDEX IF NOT EXISTS idx_task_data_task_name_success ON task_data (task_name, success);
+    CREATE INDEX IF NOT EXISTS idx_task_data_timestamp ON task_data (timestamp);
+    CREATE VIEW IF NOT EXISTS v_task_success AS
+        SELECT task_name, success, COUNT(*) AS n FROM task_data GROUP BY task_name, success;
+    CREATE VIEW IF NOT EXISTS v_task_success_total AS
+        SELECT success, COUNT(*) AS n FROM task_data GROUP BY success;
+'''
+# SQLite declared types mapped to Arrow for the raw report tables; BOOLEAN columns hold 0/1.
+ARROW_TYPES = {"REAL": pa.float64(), "INTEGER": pa.int64(), "BOOLEAN": pa.int64(), "TEXT": pa.string()}
+# Built once so the write path reuses the same SQL text and SQLite's statement cache.
+# Rows are passed as tuples in TABLE_COLUMNS order.
+INSERT_SQL = {
+    table: f"INSERT INTO {table} ({', '.join(columns)}) VALUES ({', '.join('?' * len(columns))})"
+    for table, columns in TABLE_COLUMNS.items()
+}
+SELECT_SQL = {table: f"SELECT {', '.join(columns)} FROM {table}" for table, columns in TABLE_COLUMNS.items()}
+
+# Static page content, kept at module scope so reruns don't rebuild it.
+TAB_NAMES = ("Home", "Consent", "Demographics", "Task", "Exit Questionnaire", "Report")
+HOME_MD = """
+Welcome to the Usability Testing Tool for HCI.
+In this app, you will:
+1. Provide consent for data collection.
+2. Fill out a short demographic questionnaire.
+3. Perform a specific task (or tasks).
+4. Answer an exit questionnaire about your experience.
+5. View a summary report (for demonstration purposes).
+"""
+CONSENT_BULLETS = (
+    "I understand the purpose of this usability study.",
+    "I am aware that my data will be collected solely for research and improvement purposes.",
+    "I can withdraw at any time.",
+)
+FAMILIARITY_OPTIONS = ("", "Not Familiar", "Somewhat Familiar", "Very Familiar")
+TASK_OPTIONS = (
+    "",
+    "Task 1: Wait for User Input",
+    "Task 2: Process Data",
+    "Task 3: Save to Database",
+    "Task 4: Fetch Data from API",
+    "Task 5: Execute a Scheduled Task",
+    "Task 6: Log System Events",
+    "Task 7: Retry on Failure",
+    "Task 8: Trigger Alert on Timeout",
+    "Task 9: Cache Expiry",
+    "Task 10: Generate Report",
+)
+
+@st.cache_resource
+def get_connection():
+    # The single writer connection, shared across reruns and sessions. Write transactions
+    # start with BEGIN IMMEDIATE so they take the write lock up front.
+    conn = sqlite3.connect(DB_NAME, check_same_thread=False, isolation_level="IMMEDIATE")
+    for pragma in WRITER_PRAGMAS + SQLITE_PRAGMAS:
+        conn.execute(f"PRAGMA {pragma}")
+    return conn
+
+@st.cache_resource
+def get_reader_pool():
+    # Streamlit starts a new script thread per run, so connections are pooled and checked
+    # out exclusively rather than kept thread-local.
+    pool = queue.Queue()
+    for _ in range(READER_POOL_SIZE):
+        conn = sqlite3.connect(DB_NAME, check_same_thread=False)
+        for pragma in SQLITE_PRAGMAS + ("query_only=1",):
+            conn.execute(f"PRAGMA {pragma}")
+        pool.put(conn)
+    return pool
+
+@contextmanager
+def reader():
+    pool = get_reader_pool()
+    conn = pool.get()
+    try:
+        yield conn
+    finally:
+        pool.put(conn)
+
+@st.cache_resource
+def get_write_lock():
+    # Streamlit reruns can overlap, so writes on the shared connection are serialized.
+    return threading.Lock()
+
+def migrate_timestamps(conn, table):
+    # Older databases stored "%Y-%m-%d %H:%M:%S" local-time strings in a TEXT column,
+    # or fractional epoch seconds in a REAL one.
+    column_types = {row[1]: row[2] for row in conn.execute(f"PRAGMA table_info({table})")}
+    if column_types.get("timestamp") not in ("TEXT", "REAL"):
+        return
+    # Rebuild from the table's own definition so every existing column (e.g. an id key) and
+    # constraint is kept; only the timestamp column's type changes.
+    (schema,) = conn.execute("SELECT sql FROM sqlite_master WHERE type = 'table' AND name = ?",
+                             (table,)).fetchone()
+    schema = re.sub(r"\btimestamp\s+(TEXT|REAL)\b", "timestamp INTEGER", schema, count=1)
+    columns = ", ".join(name for name in column_types if name != "timestamp")
+    # One explicit transaction: 'with conn' rolls every step back if any of them fails, so a
+    # broken rebuild can't be committed later with the table left renamed to *_old.
+    with conn:
+        conn.execute("BEGIN IMMEDIATE")
+        conn.execute(f"ALTER TABLE {table} RENAME TO {table}_old")
+        conn.execute(schema)
+        conn.execute(f"""INSERT INTO {table} (timestamp, {columns})
+            SELECT CASE typeof(timestamp)
+                    WHEN 'text' THEN CAST(strftime('%s', timestamp, 'utc') AS INTEGER)
+                    ELSE CAST(timestamp AS INTEGER)
+                END, {columns} FROM {table}_old""")
+        conn.execute(f"DROP TABLE {table}_old")
+
+# Schema setup only needs to happen once per server process, not on every rerun.
+@st.cache_resource
+def init_db():
+    conn = get_connection()
+    with get_write_lock():
+        # executescript() commits anything pending first, so never let it inherit a
+        # transaction left open by a failed earlier attempt.
+        if conn.in_transaction:
+            conn.rollback()
+        # executescript() hands each batch of DDL to SQLite in one call and commits it.
+        conn.executescript(";\n".join(TABLE_SCHEMAS.values()))
+        for table in TABLE_SCHEMAS:
+            migrate_timestamps(conn, table)
+        conn.executescript(DERIVED_SCHEMA)
+
+def insert_row(table, values):
+    conn = get_connection()
+    with get_write_lock(), conn:
+        conn.execute(INSERT_SQL[table], values)
+
+def insert_rows(table, rows):
+    conn = get_connection()
+    with get_write_lock(), conn:
+        conn.executemany(INSERT_SQL[table], rows)
 
-def insert_data(table, data_dict):
-    with get_connection() as conn:
-        df = pd.DataFrame([data_dict])
-        df.to_sql(table, conn, if_exists='append', index=False)
+def queue_insert(table, values, flush_size=TASK_FLUSH_SIZE):
+    pending = st.session_state.setdefault(f"pending_{table}", [])
+    pending.append(values)
+    if len(pending) >= flush_size:
+        flush_pending(table)
+
+def flush_pending(table):
+    rows = st.session_state.pop(f"pending_{table}", [])
+    if rows:
+        insert_rows(table, rows)
+
+def run_query(sql):
+    with reader() as conn:
+        cursor = conn.execute(sql)
+        columns = [d[0] for d in cursor.description]
+        # Convert in chunks so only FETCH_SIZE row tuples are alive at once.
+        chunks = []
+        while rows := cursor.fetchmany(FETCH_SIZE):
+            chunks.append(pd.DataFrame.from_records(rows, columns=columns))
+    if not chunks:
+        return pd.DataFrame(columns=columns)
+    return pd.concat(chunks, ignore_index=True)
+
+def arrow_schema(conn, table):
+    declared = {row[1]: row[2] for row in conn.execute(f"PRAGMA table_info({table})")}
+    return pa.schema([(column, ARROW_TYPES[declared[column]]) for column in TABLE_COLUMNS[table]])
 
 def load_data(table):
-    with get_connection() as conn:
-        return pd.read_sql_query(f"SELECT * FROM {table}", conn)
+    # Raw tables are built as Arrow, which st.dataframe renders without a pandas round trip.
+    with reader() as conn:
+        schema = arrow_schema(conn, table)
+        cursor = conn.execute(SELECT_SQL[table])
+        batches = []
+        while rows := cursor.fetchmany(FETCH_SIZE):
+            arrays = [pa.array(values, type=field.type) for values, field in zip(zip(*rows), schema)]
+            batches.append(pa.RecordBatch.from_arrays(arrays, schema=schema))
+    return pa.Table.from_batches(batches, schema=schema)
+
+def db_mtime():
+    # With WAL, commits land in the -wal file before they are checkpointed into the main file.
+    paths = (DB_NAME, f"{DB_NAME}-wal")
+    return max(os.path.getmtime(p) for p in paths if os.path.exists(p))
+
+# mtime is a regular (hashed) argument so any write to the database invalidates the cache.
+@st.cache_data(show_spinner=False, max_entries=REPORT_CACHE_ENTRIES)
+def cached_load_data(table, mtime):
+    data = load_data(table)
+    # Stored values are UTC epoch seconds; the zone is kept on the type so the table labels it.
+    return data.set_column(data.schema.get_field_index('timestamp'), 'timestamp',
+                           data['timestamp'].cast(pa.timestamp('s', tz='UTC')))
+
+# The charts only need per-group counts, so the aggregation runs in SQLite.
+@st.cache_data(show_spinner=False, max_entries=CHART_CACHE_ENTRIES)
+def cached_task_success_counts(mtime):
+    return run_query("SELECT success, n FROM v_task_success_total ORDER BY n DESC")
+
+@st.cache_data(show_spinner=False, max_entries=CHART_CACHE_ENTRIES)
+def cached_task_success_rates(mtime):
+    # Percentages come from the window function; only the tiny pivot for the stacked chart
+    # happens here, inside the cache, as {status: {task: pct}}.
+    rates = run_query('''SELECT task_name, success,
+            100.0 * n / SUM(n) OVER (PARTITION BY task_name) AS pct
+        FROM v_task_success''')
+    return rates.pivot(index='task_name', columns='success', values='pct').fillna(0).to_dict()
+
+# Figures are built with graph_objects (no plotly express wide-to-long reshaping) and
+# memoized as plain dicts so reruns skip rebuilding them.
+@st.cache_data(show_spinner=False, max_entries=CHART_CACHE_ENTRIES)
+def make_success_fig(statuses, counts):
+    fig = go.Figure(go.Bar(x=list(statuses), y=list(counts)))
+    fig.update_layout(title="Task Success Counts", xaxis_title="Success Status", yaxis_title="Count")
+    return fig.to_dict()
+
+@st.cache_data(show_spinner=False, max_entries=CHART_CACHE_ENTRIES)
+def make_success_rate_fig(rates):
+    fig = go.Figure([go.Bar(name=status, x=list(per_task), y=list(per_task.values()))
+                     for status, per_task in rates.items()])
+    fig.update_layout(barmode='stack', title="Success Rates per Task", xaxis_title="Task Name",
+                      yaxis_title="Percentage", legend_title_text="Success Status")
+    return fig.to_dict()
+
+# Fragments rerun on their own widgets, so timer clicks and report interactions skip the rest of the page.
+@st.fragment
+def render_task_page():
+    st.header("Task Page")
+    st.write("Please select a task and record your experience completing it.")
+
+    selected_task = st.selectbox("Select Task", options=TASK_OPTIONS)
+    st.write("Task Description: Perform the example task in our system...")
+
+    if "previous_task" not in st.session_state or st.session_state["previous_task"] != selected_task:
+        st.session_state.update(previous_task=selected_task, task_completed=False, start_time=None)
+
+    success = ""
+
+    if selected_task:
+        if not st.session_state.get("task_completed", False):
+            if st.button("Start Task Timer"):
+                st.session_state["start_time"] = time.time()
+                st.info("Task timer started. Complete your task and then click 'Stop Task Timer.'")
+
+            if st.button("Stop Task Timer"):
+                if st.session_state.get("start_time"):
+                    duration = time.time() - st.session_state["start_time"]
+                    st.session_state.update(task_duration=duration, start_time=None, task_completed=True)
+                    st.success(f"Task completed in {duration:.2f} seconds!")
+
+        # The timer buttons above need to act immediately; the result inputs only matter on save.
+        with st.form("task_form"):
+            success = st.radio("Was the task completed successfully?", ["No", "Yes", "Partial"])
+            notes = st.text_area("Observer Notes")
+            submitted = st.form_submit_button("Save Task Results")
+            if submitted:
+                if not success:
+                    st.warning("Please select a success status before saving.")
+                else:
+                    queue_insert("task_data", (int(time.time()), selected_task, success,
+                                               st.session_state.get("task_duration"), notes))
+                    st.success("Task data recorded.")
+                    st.session_state.pop("task_duration", None)
+                    st.session_state["task_completed"] = False
+
+    pending_tasks = len(st.session_state.get("pending_task_data", []))
+    if pending_tasks:
+        st.info(f"{pending_tasks} task result(s) pending. They are saved with the exit questionnaire.")
+        if st.button("Save Pending Task Results"):
+            flush_pending("task_data")
+            st.success("Pending task data saved.")
+
+@st.fragment
+def render_report():
+    st.header("Usability Report - Aggregated Results")
+
+    mtime = db_mtime()
+
+    def render_table_and_info(title, table_name):
+        # Raw tables are only queried once the viewer switches them on; toggling reruns just
+        # this fragment.
+        if not st.toggle(f"Show {title}", key=f"show_{table_name}"):
+            return
+        data = cached_load_data(table_name, mtime)
+        if data.num_rows:
+            st.dataframe(data)
+        else:
+            st.info(f"No {title.lower()} available yet.")
+
+    render_table_and_info("Consent Data", "consent_data")
+    render_table_and_info("Demographic Data", "demographic_data")
+    render_table_and_info("Task Performance Data", "task_data")
+    render_table_and_info("Exit Questionnaire Data", "exit_data")
+
+    # The charts are driven by the aggregated frames only, never the raw task table.
+    task_success_counts = cached_task_success_counts(mtime)
+    if not task_success_counts.empty:
+        st.plotly_chart(go.Figure(make_success_fig(tuple(task_success_counts['success']),
+                                                   tuple(task_success_counts['n'].tolist()))))
+
+        st.plotly_chart(go.Figure(make_success_rate_fig(cached_task_success_rates(mtime))))
 
 
 def main():
     st.set_page_config(page_title="Usability Testing Tool", layout="wide")
     init_db()
 
-    home, consent, demographics, tasks, exit, report = st.tabs(
-        ["Home", "Consent", "Demographics", "Task", "Exit Questionnaire", "Report"]
-    )
+    home, consent, demographics, tasks, exit, report = st.tabs(TAB_NAMES)
 
     with home:
         st.header("Introduction")
-        st.write("""
-        Welcome to the Usability Testing Tool for HCI.
-        In this app, you will:
-        1. Provide consent for data collection.
-        2. Fill out a short demographic questionnaire.
-        3. Perform a specific task (or tasks).
-        4. Answer an exit questionnaire about your experience.
-        5. View a summary report (for demonstration purposes).
-        """)
+        st.write(HOME_MD)
 
     with consent:
         st.header("Consent Form")
         st.write("Please read the consent form below and confirm your agreement:")
         st.subheader("Consent Agreement:")
-        st.write("- I understand the purpose of this usability study.")
-        st.write("- I am aware that my data will be collected solely for research and improvement purposes.")
-        st.write("- I can withdraw at any time.")
+        for bullet in CONSENT_BULLETS:
+            st.write(f"- {bullet}")
         consent_given = st.checkbox("I agree to the terms above")
 
         if st.button("Submit Consent"):
             if not consent_given:
                 st.warning("You must agree to the consent terms before proceeding.")
             else:
-                insert_data("consent_data", {
-                    "timestamp": time.strftime("%Y-%m-%d %H:%M:%S"),
-                    "consent_given": consent_given
-                })
+                insert_row("consent_data", (int(time.time()), consent_given))
                 st.success("Your consent has been recorded. Thank you!")
 
     with demographics:
@@ -91,75 +391,17 @@ def main():
             age = st.number_input("Age:", min_value=0, max_value=100, step=1, format="%d")
             occupation = st.text_input("Occupation")
             familiarity = st.selectbox("Familiarity with similar tools?",
-                                       options=["", "Not Familiar", "Somewhat Familiar", "Very Familiar"])
+                                       options=FAMILIARITY_OPTIONS)
             submitted = st.form_submit_button("Submit Demographics")
             if submitted:
                 if not age or not occupation or not familiarity:
                     st.warning("Please fill out the form")
                 else:
-                    insert_data("demographic_data", {
-                        "timestamp": time.strftime("%Y-%m-%d %H:%M:%S"),
-                        "name": name,
-                        "age": age,
-                        "occupation": occupation,
-                        "familiarity": familiarity
-                    })
+                    insert_row("demographic_data", (int(time.time()), name, age, occupation, familiarity))
                     st.success("Demographic data saved.")
 
     with tasks:
-        st.header("Task Page")
-        st.write("Please select a task and record your experience completing it.")
-
-        selected_task = st.selectbox("Select Task", options=["", "Task 1: Wait for User Input",
-                                                             "Task 2: Process Data",
-                                                             "Task 3: Save to Database",
-                                                             "Task 4: Fetch Data from API",
-                                                             "Task 5: Execute a Scheduled Task",
-                                                             "Task 6: Log System Events",
-                                                             "Task 7: Retry on Failure",
-                                                             "Task 8: Trigger Alert on Timeout",
-                                                             "Task 9: Cache Expiry",
-                                                             "Task 10: Generate Report"])
-        st.write("Task Description: Perform the example task in our system...")
-
-        if "previous_task" not in st.session_state or st.session_state["previous_task"] != selected_task:
-            st.session_state["previous_task"] = selected_task
-            st.session_state["task_completed"] = False
-            st.session_state["start_time"] = None
-
-        success = ""
-
-        if selected_task:
-            if not st.session_state.get("task_completed", False):
-                if st.button("Start Task Timer"):
-                    st.session_state["start_time"] = time.time()
-                    st.info("Task timer started. Complete your task and then click 'Stop Task Timer.'")
-
-                if st.button("Stop Task Timer"):
-                    if st.session_state.get("start_time"):
-                        duration = time.time() - st.session_state["start_time"]
-                        st.session_state["task_duration"] = duration
-                        st.session_state["task_completed"] = True
-                        st.success(f"Task completed in {duration:.2f} seconds!")
-                        st.session_state["start_time"] = None
-                        st.session_state["task_completed"] = False
-
-            success = st.radio("Was the task completed successfully?", ["No", "Yes", "Partial"])
-            notes = st.text_area("Observer Notes")
-
-            if st.button("Save Task Results"):
-                if not success:
-                    st.warning("Please select a success status before saving.")
-                else:
-                    insert_data("task_data", {
-                        "timestamp": time.strftime("%Y-%m-%d %H:%M:%S"),
-                        "task_name": selected_task,
-                        "success": success,
-                        "duration_seconds": st.session_state.get("task_duration", None),
-                        "notes": notes
-                    })
-                    st.success("Task data saved.")
-                    st.session_state.pop("task_duration", None)
+        render_task_page()
 
     with exit:
         st.header("Exit Questionnaire")
@@ -168,42 +410,12 @@ def main():
             difficulty = st.slider("Overall Difficulty (1=Very Easy,5=Very Hard)", 1, 5)
             open_feedback = st.text_area("Additional feedback or comments:")
             if st.form_submit_button("Submit Exit Questionnaire"):
-                insert_data("exit_data", {
-                    "timestamp": time.strftime("%Y-%m-%d %H:%M:%S"),
-                    "satisfaction": satisfaction,
-                    "difficulty": difficulty,
-                    "open_feedback": open_feedback
-                })
+                flush_pending("task_data")
+                insert_row("exit_data", (int(time.time()), satisfaction, difficulty, open_feedback))
                 st.success("Exit questionnaire data saved.")
 
     with report:
-        st.header("Usability Report - Aggregated Results")
-
-        def render_table_and_info(title, table_name):
-            st.write(f"**{title}**")
-            df = load_data(table_name)
-            if not df.empty:
-                st.dataframe(df)
-            else:
-                st.info(f"No {title.lower()} available yet.")
-            return df
-
-        consent_df = render_table_and_info("Consent Data", "consent_data")
-        demo_df = render_table_and_info("Demographic Data", "demographic_data")
-        task_df = render_table_and_info("Task Performance Data", "task_data")
-        exit_df = render_table_and_info("Exit Questionnaire Data", "exit_data")
-
-        if not task_df.empty:
-            task_success_counts = task_df['success'].value_counts()
-            fig = px.bar(task_success_counts, x=task_success_counts.index, y=task_success_counts.values,
-                         labels={'x': 'Success Status', 'y': 'Count'}, title="Task Success Counts")
-            st.plotly_chart(fig)
-
-            task_success_per_task = task_df.groupby('task_name')['success'].value_counts().unstack().fillna(0)
-            task_success_per_task = task_success_per_task.div(task_success_per_task.sum(axis=1), axis=0) * 100
-            fig = px.bar(task_success_per_task, x=task_success_per_task.index, y=task_success_per_task.columns,
-                         title="Success Rates per Task", labels={'x': 'Task Name', 'y': 'Percentage'})
-            st.plotly_chart(fig)
+        render_report()
 
 if __name__ == "__main__":
     main()